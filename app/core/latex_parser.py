@@ -1,5 +1,10 @@
 import re
 import os
+import sys
+import bisect
+import functools
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 import logging
@@ -8,19 +13,146 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+
+def _compile_atomic(pattern: str) -> re.Pattern:
+    """
+    Compile a pattern containing atomic groups (?>...)
+    
+    Atomic groups are only supported by the re module from Python 3.11; on older
+    versions they are compiled as ordinary non-capturing groups, which match the
+    same text but may backtrack further before failing.
+    """
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return re.compile(pattern.replace("(?>", "(?:"))
+
+
+# Patterns compiled once at import instead of on every call
+_SECTION_RE = re.compile(r"\\(section|subsection|subsubsection)\{([^}\n]+)\}")
+
+# Environment bodies use the "unrolled loop" form [^\\]*(?:\\(?!end...)[^\\]*)*
+# rather than a lazy (.*?): it matches up to the same first \end{...}, but runs
+# of ordinary characters are consumed in one step instead of one at a time.
+# The loop is atomic so that an unclosed environment fails without backtracking
+_ITEMIZE_RE = _compile_atomic(r"\\begin\{itemize\}((?>[^\\]*(?:\\(?!end\{itemize\})[^\\]*)*))\\end\{itemize\}")
+_ITEM_RE = _compile_atomic(r"\\item\s+((?>[^\\\n]*(?:(?:\\(?!item)|\n(?!\\end))[^\\\n]*)*))(?=\\item|\n\\end)")
+_ENV_RE = _compile_atomic(r"\\begin\{([^}]*)\}((?>[^\\]*(?:\\(?!end\{\1\})[^\\]*)*))\\end\{\1\}")
+
+# Title (\textbf), company (\textit) and date (\hfill) of an experience entry,
+# found together in one pass; the matched field is reported by lastgroup
+_EXP_FIELDS_RE = re.compile(
+    r"\\textbf\{(?P<title>[^}\n]*)\}"
+    r"|\\textit\{(?P<company>[^}\n]*)\}"
+    r"|\\hfill\{?(?P<date>[^}\\\n]*)"
+)
+# The same fields one at a time, for a field nested inside another one's braces
+# (\textbf{\textit{...}}), which the combined pass consumes with the outer match
+_EXP_FIELD_RES = {
+    "title": re.compile(r"\\textbf\{([^}\n]*)\}"),
+    "company": re.compile(r"\\textit\{([^}\n]*)\}"),
+    "date": re.compile(r"\\hfill\{?([^}\\\n]*)"),
+}
+_NEWLINE_RE = re.compile(r"\n")
+
+# Section names that extract_skills and extract_experience read from
+_SKILL_SECTION_KEYS = frozenset({"Skills", "Technical Skills", "Core Competencies"})
+_EXPERIENCE_SECTION_KEYS = frozenset({"Experience", "Work Experience", "Professional Experience"})
+
+
+def _compute_line_starts(text: str) -> array:
+    """
+    Compute the offset at which each line of a text starts
+    
+    Args:
+        text: Text to index
+    
+    Returns:
+        array: Line start offsets, followed by the length of the text
+    """
+    line_starts = array('q', [0])
+    line_starts.extend(match.end() for match in _NEWLINE_RE.finditer(text))
+    if line_starts[-1] != len(text):
+        line_starts.append(len(text))
+    return line_starts
+
+
 class LaTeXParser:
     """
     Parser for LaTeX CV documents that extracts sections, content, and structure.
     Enables modification and customization of LaTeX documents based on job requirements.
     """
     
+    # Insert offsets for the keyword positions accepted by add_section
+    _POSITION_OFFSETS = {
+        "start": lambda parser: parser._begin_off,
+        "end": lambda parser: parser._end_off,
+    }
+    
     def __init__(self):
         self.document_structure = {}
-        self.preamble = ""
+        self._preamble = None
         self.sections = {}
-        self.begin_document_index = -1
-        self.end_document_index = -1
-        self.raw_content = []
+        self._text = ""
+        # Span of the document body: just past the \\begin{document} line and the
+        # start of the \\end{document} line (-1 until a document has been parsed)
+        self._begin_off = -1
+        self._end_off = -1
+        self._line_starts = None
+        self._lines = None
+        self._has_duplicate_sections = False
+    
+    def reset(self) -> None:
+        """
+        Clear the parsed document so the instance can be reused for another one.
+        The section containers are emptied in place rather than reallocated.
+        
+        Example:
+            parser = LaTeXParser()
+            for path in paths:
+                parser.reset()
+                parser.parse_file(path)
+        """
+        self.document_structure.clear()
+        self._preamble = None
+        self.sections.clear()
+        self._text = ""
+        self._begin_off = -1
+        self._end_off = -1
+        self._line_starts = None
+        self._lines = None
+        self._has_duplicate_sections = False
+    
+    @property
+    def preamble(self) -> str:
+        """The preamble (content before \\begin{document}), sliced from the text on first access"""
+        if self._preamble is None:
+            if self._begin_off > 0:
+                self._preamble = self._text[:self._text.rfind("\n", 0, self._begin_off - 1) + 1]
+            else:
+                self._preamble = ""
+        return self._preamble
+    
+    @property
+    def begin_document_index(self) -> int:
+        """Line index of \\begin{document}, or -1 if no document has been parsed"""
+        return self._line_at(self._begin_off - 1) if self._begin_off != -1 else -1
+    
+    @property
+    def end_document_index(self) -> int:
+        """Line index of \\end{document}, or -1 if no document has been parsed"""
+        return self._line_at(self._end_off) if self._end_off != -1 else -1
+    
+    @property
+    def raw_content(self) -> List[str]:
+        """
+        The document as a list of lines, split from the underlying text on first
+        access and cached until the next edit. Treat it as read-only.
+        """
+        if self._lines is None:
+            line_starts = self._get_line_starts()
+            self._lines = [self._text[start:end] for start, end in zip(line_starts, line_starts[1:])]
+        return self._lines
         
     def parse_file(self, file_path: str) -> bool:
         """
@@ -34,10 +166,11 @@ class LaTeXParser:
         """
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
-                self.raw_content = file.readlines()
+                text = file.read()
             
+            self.reset()
+            self._text = text
             self._identify_document_boundaries()
-            self._extract_preamble()
             self._extract_sections()
             
             logger.info(f"Successfully parsed LaTeX file: {file_path}")
@@ -49,7 +182,8 @@ class LaTeXParser:
     
     def parse_content(self, latex_content: str) -> bool:
         """
-        Parse LaTeX content from a string
+        Parse LaTeX content from a string. "\\r\\n" and "\\r" line endings are
+        converted to "\\n", as parse_file does when reading a file.
         
         Args:
             latex_content: String containing LaTeX content
@@ -58,10 +192,11 @@ class LaTeXParser:
             bool: True if parsing was successful, False otherwise
         """
         try:
-            self.raw_content = latex_content.splitlines(True)
-            
+            if "\r" in latex_content:
+                latex_content = latex_content.replace("\r\n", "\n").replace("\r", "\n")
+            self.reset()
+            self._text = latex_content
             self._identify_document_boundaries()
-            self._extract_preamble()
             self._extract_sections()
             
             logger.info("Successfully parsed LaTeX content from string")
@@ -71,61 +206,184 @@ class LaTeXParser:
             logger.error(f"Error parsing LaTeX content: {e}")
             return False
     
+    def _get_line_starts(self) -> array:
+        """
+        Get the offset at which each line of the text starts, computing it on first use
+        
+        Returns:
+            array: Line start offsets, followed by the length of the text
+        """
+        if self._line_starts is None:
+            self._line_starts = _compute_line_starts(self._text)
+        return self._line_starts
+    
+    def _line_at(self, offset: int) -> int:
+        """Return the index of the line containing the given text offset"""
+        return bisect.bisect_right(self._get_line_starts(), offset) - 1
+    
     def _identify_document_boundaries(self) -> None:
-        """Identify the begin and end document tags"""
-        for i, line in enumerate(self.raw_content):
-            if r"\begin{document}" in line:
-                self.begin_document_index = i
-            elif r"\end{document}" in line:
-                self.end_document_index = i
+        """Identify the begin and end document tags (the last occurrence of each)"""
+        begin = self._text.rfind(r"\begin{document}")
+        end = self._text.rfind(r"\end{document}")
                 
-        if self.begin_document_index == -1 or self.end_document_index == -1:
+        if begin == -1 or end == -1:
+            self._begin_off = self._end_off = -1
             raise ValueError("Could not find document boundaries (\\begin{document} and \\end{document})")
+        
+        begin_line_end = self._text.find("\n", begin)
+        begin_off = begin_line_end + 1 if begin_line_end != -1 else len(self._text)
+        end_off = self._text.rfind("\n", 0, end) + 1
+        
+        # The body lies between the two marker lines, so \end{document} must be on a later line
+        if end_off < begin_off:
+            self._begin_off = self._end_off = -1
+            raise ValueError("Could not find document boundaries (\\end{document} must follow \\begin{document})")
+        
+        self._begin_off = begin_off
+        self._end_off = end_off
     
-    def _extract_preamble(self) -> None:
-        """Extract the preamble (content before \begin{document})"""
-        if self.begin_document_index > 0:
-            self.preamble = ''.join(self.raw_content[:self.begin_document_index])
+    def _scan_headers(self, start: int, stop: int) -> List[Tuple[int, str]]:
+        """
+        Find the section headers within a range of whole lines of the text
+        
+        Args:
+            start: Offset of the first line to scan
+            stop: Offset just past the last line to scan
+            
+        Returns:
+            list: (line start offset, section name) for the first header on each line that has one
+        """
+        # Every header contains "section{", so a plain substring search lets us
+        # skip the regex entirely when there are no sections and otherwise start
+        # the sweep at the first candidate rather than at the top of the range
+        first_candidate = self._text.find("section{", start, stop)
+        if first_candidate == -1:
+            return []
+        scan_start = max(start, first_candidate - len("\\subsub"))
+        
+        # The sweep itself runs inside the regex engine's C loop, which jumps between
+        # backslashes; a compiled (Numba) scanner over the same text measured no faster
+        headers = []
+        for match in _SECTION_RE.finditer(self._text, scan_start, stop):
+            line_start = self._text.rfind("\n", 0, match.start()) + 1
+            if not headers or headers[-1][0] != line_start:
+                # Interned so lookups with literal names (e.g. "Skills") match by identity
+                headers.append((line_start, sys.intern(match.group(2))))
+        return headers
+    
+    def _store_sections(self, headers: List[Tuple[int, str]], stop: int) -> None:
+        """
+        Record consecutive sections, each running from its header line up to the next header.
+        Only the offsets are stored; the content is sliced out by get_section when first requested.
+        
+        Args:
+            headers: (line start offset, section name) pairs in document order
+            stop: Offset just past the end of the last section
+        """
+        for i, (start, section_name) in enumerate(headers):
+            self.sections[section_name] = {
+                'start': start,
+                'end': headers[i + 1][0] if i + 1 < len(headers) else stop,
+                '_content': None
+            }
     
     def _extract_sections(self) -> None:
         """Extract sections from the document body"""
-        # Regular expression to match section commands
-        section_pattern = re.compile(r"\\(section|subsection|subsubsection)\{([^}]+)\}")
+        self.sections.clear()
+        headers = self._scan_headers(self._begin_off, self._end_off)
+        self._store_sections(headers, self._end_off)
+        self._has_duplicate_sections = len(self.sections) != len(headers)
+    
+    def _shift_sections_after(self, pos: int, delta: int) -> None:
+        """
+        Shift the offsets of every section starting at or after a position
         
-        current_section = None
-        section_content = []
-        section_start_line = -1
+        Args:
+            pos: First offset affected by the shift
+            delta: Number of characters inserted (positive) or removed (negative)
+        """
+        if delta:
+            for section in self.sections.values():
+                if section['start'] >= pos:
+                    section['start'] += delta
+                    section['end'] += delta
+    
+    def _replace_text(self, start: int, stop: int, new_text: str) -> int:
+        """
+        Replace whole lines of the document body, moving the \\end{document}
+        offset along with the text. Sections are left untouched.
         
-        # Process the document body (between begin and end document)
-        for i in range(self.begin_document_index + 1, self.end_document_index):
-            line = self.raw_content[i]
+        Args:
+            start: Offset of the first line to replace
+            stop: Offset just past the last line to replace
+            new_text: Replacement text
             
-            # Check if this line starts a new section
-            match = section_pattern.search(line)
-            if match:
-                # If we were already processing a section, save it
-                if current_section:
-                    self.sections[current_section] = {
-                        'content': ''.join(section_content),
-                        'start_line': section_start_line,
-                        'end_line': i - 1
-                    }
-                
-                # Start new section
-                current_section = match.group(2)  # Section name
-                section_content = [line]
-                section_start_line = i
-            elif current_section:
-                # Add line to current section
-                section_content.append(line)
-        
-        # Don't forget to add the last section
-        if current_section:
-            self.sections[current_section] = {
-                'content': ''.join(section_content),
-                'start_line': section_start_line,
-                'end_line': self.end_document_index - 1
-            }
+        Returns:
+            int: Change in the length of the text
+        """
+        # Keep the splice line-aligned so the following line is not glued onto the new text
+        if new_text and not new_text.endswith("\n"):
+            new_text += "\n"
+        
+        offset_delta = len(new_text) - (stop - start)
+        self._text = self._text[:start] + new_text + self._text[stop:]
+        
+        # The body markers move arithmetically; the line index and line list are rebuilt only if asked for
+        if stop <= self._end_off:
+            self._end_off += offset_delta
+        self._line_starts = None
+        self._lines = None
+        
+        return offset_delta
+    
+    def _splice_text(self, start: int, stop: int, new_text: str) -> None:
+        """
+        Replace whole lines of the text and update the sections incrementally
+        instead of re-parsing the whole document.
+        
+        Only the window from the header of the section preceding the splice to
+        the next untouched header is re-scanned. Documents with duplicate
+        section names fall back to a full re-parse, since the section that
+        "wins" a name then depends on headers outside the window.
+        
+        Args:
+            start: Offset of the first line to replace
+            stop: Offset just past the last line to replace (equal to start for a pure insertion)
+            new_text: Text to insert in their place
+        """
+        offset_delta = self._replace_text(start, stop, new_text)
+        
+        if self._has_duplicate_sections:
+            self._extract_sections()
+            return
+        
+        # Drop the sections whose header falls inside the window, keeping the rest
+        window_start = start
+        for section_name, section in list(self.sections.items()):
+            if section['start'] < start <= section['end']:
+                window_start = section['start']
+                del self.sections[section_name]
+            elif start <= section['start'] < stop:
+                del self.sections[section_name]
+        
+        self._shift_sections_after(stop, offset_delta)
+        window_stop = min(
+            (section['start'] for section in self.sections.values() if section['start'] >= start),
+            default=self._end_off
+        )
+        
+        headers = self._scan_headers(window_start, window_stop)
+        names = [section_name for _, section_name in headers]
+        if len(set(names)) != len(names) or any(section_name in self.sections for section_name in names):
+            self._extract_sections()
+            return
+        
+        self._store_sections(headers, window_stop)
+        
+        # Keep the sections in document order, as a full parse would
+        ordered = sorted(self.sections.items(), key=lambda item: item[1]['start'])
+        self.sections.clear()
+        self.sections.update(ordered)
     
     def get_section(self, section_name: str) -> Optional[str]:
         """
@@ -138,7 +396,10 @@ class LaTeXParser:
             str or None: Content of the section if found, None otherwise
         """
         if section_name in self.sections:
-            return self.sections[section_name]['content']
+            section = self.sections[section_name]
+            if section['_content'] is None:
+                section['_content'] = self._text[section['start']:section['end']]
+            return section['_content']
         return None
     
     def get_all_sections(self) -> Dict[str, Dict[str, Any]]:
@@ -147,6 +408,7 @@ class LaTeXParser:
         
         Returns:
             dict: Dictionary with section names as keys and section details as values
+                (start/end offsets into generate_latex(); use get_section for the content)
         """
         return self.sections
     
@@ -158,19 +420,18 @@ class LaTeXParser:
             list: List of skills found in the document
         """
         skills = []
-        skill_section_names = ["Skills", "Technical Skills", "Core Competencies"]
         
-        for section_name in skill_section_names:
+        # Visit only the candidate sections the document has, in document order
+        found = self.sections.keys() & _SKILL_SECTION_KEYS
+        for section_name in sorted(found, key=lambda name: self.sections[name]['start']):
             section_content = self.get_section(section_name)
             if section_content:
                 # Look for itemize environments
-                items_pattern = re.compile(r"\\begin\{itemize\}(.*?)\\end\{itemize\}", re.DOTALL)
-                items_match = items_pattern.search(section_content)
+                items_match = _ITEMIZE_RE.search(section_content)
                 
                 if items_match:
                     items = items_match.group(1)
-                    item_pattern = re.compile(r"\\item\s+(.*?)(?=\\item|\n\\end)", re.DOTALL)
-                    for match in item_pattern.finditer(items):
+                    for match in _ITEM_RE.finditer(items):
                         skills.append(match.group(1).strip())
                 
         return skills
@@ -183,29 +444,37 @@ class LaTeXParser:
             list: List of dictionaries with experience details
         """
         experiences = []
-        experience_section_names = ["Experience", "Work Experience", "Professional Experience"]
         
-        for section_name in experience_section_names:
+        # Visit only the candidate sections the document has, in document order
+        found = self.sections.keys() & _EXPERIENCE_SECTION_KEYS
+        for section_name in sorted(found, key=lambda name: self.sections[name]['start']):
             section_content = self.get_section(section_name)
             if not section_content:
                 continue
                 
             # Pattern to match experience entries (assuming they use some environment)
-            entry_pattern = re.compile(r"\\begin\{(.*?)\}(.*?)\\end\{\1\}", re.DOTALL)
-            
-            for match in entry_pattern.finditer(section_content):
+            for match in _ENV_RE.finditer(section_content):
                 env_name = match.group(1)
                 content = match.group(2)
                 
-                # Look for key information within this entry
-                title_match = re.search(r"\\textbf\{(.*?)\}", content)
-                company_match = re.search(r"\\textit\{(.*?)\}", content)
-                date_match = re.search(r"\\hfill\{?(.*?)\}?(?=\\\\|$)", content)
+                # Look for key information within this entry, keeping the first match of each field
+                fields = {}
+                for field_match in _EXP_FIELDS_RE.finditer(content):
+                    fields.setdefault(field_match.lastgroup, field_match.group(field_match.lastgroup))
+                    if len(fields) == 3:
+                        break
+                else:
+                    # Some field was not found; it may be nested in another field's braces
+                    for field, field_re in _EXP_FIELD_RES.items():
+                        if field not in fields:
+                            field_match = field_re.search(content)
+                            if field_match:
+                                fields[field] = field_match.group(1)
                 
                 experience = {
-                    "title": title_match.group(1) if title_match else "",
-                    "company": company_match.group(1) if company_match else "",
-                    "date": date_match.group(1) if date_match else "",
+                    "title": fields.get("title", ""),
+                    "company": fields.get("company", ""),
+                    "date": fields.get("date", ""),
                     "content": content
                 }
                 
@@ -224,20 +493,29 @@ class LaTeXParser:
         Returns:
             bool: True if modification was successful, False otherwise
         """
+        if self._begin_off == -1:
+            logger.error("No document has been parsed")
+            return False
+        
         if section_name not in self.sections:
             logger.error(f"Section '{section_name}' not found in the document")
             return False
             
         section = self.sections[section_name]
-        start = section['start_line']
-        end = section['end_line']
         
-        # Replace the section content in raw_content
-        self.raw_content[start:end+1] = new_content.splitlines(True)
+        # When the new content keeps the section's header on its first line and adds no
+        # other header, the layout is unchanged and only the offsets after it move
+        first_line_end = new_content.find("\n")
+        header = _SECTION_RE.search(new_content, 0, first_line_end if first_line_end != -1 else len(new_content))
+        if header and header.group(2) == section_name and new_content.find("section{", header.end()) == -1:
+            delta = self._replace_text(section['start'], section['end'], new_content)
+            self._shift_sections_after(section['end'], delta)
+            section['end'] += delta
+            section['_content'] = None
+            return True
         
-        # Update the document structure
-        self._identify_document_boundaries()
-        self._extract_sections()
+        # Replace the section content and update the document structure
+        self._splice_text(section['start'], section['end'], new_content)
         
         return True
     
@@ -253,28 +531,26 @@ class LaTeXParser:
         Returns:
             bool: True if addition was successful, False otherwise
         """
+        if self._begin_off == -1:
+            logger.error("No document has been parsed")
+            return False
+        
         section_cmd = f"\\section{{{section_name}}}\n"
         full_content = section_cmd + content
         
         try:
             # Insert at specified position
-            if position == "start":
-                insert_pos = self.begin_document_index + 1
-            elif position == "end":
-                insert_pos = self.end_document_index
+            position_offset = self._POSITION_OFFSETS.get(position)
+            if position_offset is not None:
+                insert_pos = position_offset(self)
             elif position in self.sections:
-                insert_pos = self.sections[position]['end_line'] + 1
+                insert_pos = self.sections[position]['end']
             else:
                 logger.error(f"Invalid position: {position}")
                 return False
                 
             # Insert the new section
-            new_lines = full_content.splitlines(True)
-            self.raw_content[insert_pos:insert_pos] = new_lines
-            
-            # Update document structure
-            self._identify_document_boundaries()
-            self._extract_sections()
+            self._splice_text(insert_pos, insert_pos, full_content)
             
             return True
             
@@ -292,6 +568,10 @@ class LaTeXParser:
         Returns:
             bool: True if reordering was successful, False otherwise
         """
+        if self._begin_off == -1:
+            logger.error("No document has been parsed")
+            return False
+        
         try:
             # Check if all sections exist
             for section in order:
@@ -300,18 +580,19 @@ class LaTeXParser:
                     return False
             
             # Create a new document body
-            new_body = []
-            for section in order:
-                section_data = self.sections[section]
-                content_lines = self.raw_content[section_data['start_line']:section_data['end_line']+1]
-                new_body.extend(content_lines)
+            parts = [self._text[self.sections[section]['start']:self.sections[section]['end']] for section in order]
             
             # Replace document body
-            self.raw_content[self.begin_document_index+1:self.end_document_index] = new_body
+            self._replace_text(self._begin_off, self._end_off, ''.join(parts))
             
-            # Update document structure
-            self._identify_document_boundaries()
-            self._extract_sections()
+            # Update document structure: each section now starts where the previous one
+            # ends, so the new offsets follow from the piece lengths without a re-scan
+            self.sections.clear()
+            offset = self._begin_off
+            for section, part in zip(order, parts):
+                self.sections[sys.intern(section)] = {'start': offset, 'end': offset + len(part), '_content': part}
+                offset += len(part)
+            self._has_duplicate_sections = len(self.sections) != len(order)
             
             return True
             
@@ -326,7 +607,24 @@ class LaTeXParser:
         Returns:
             str: Complete LaTeX document content
         """
-        return ''.join(self.raw_content)
+        return self._text
+    
+    @classmethod
+    def parse_many(cls, file_paths: List[str], workers: Optional[int] = None) -> List[Optional[Dict[str, str]]]:
+        """
+        Parse several LaTeX files in parallel worker processes.
+        Each worker reuses a single parser instance for all the files it handles.
+        
+        Args:
+            file_paths: Paths to the LaTeX files
+            workers: Number of worker processes (defaults to the number of CPUs)
+            
+        Returns:
+            list: For each path, in order, a dictionary mapping section names to their
+                content, or None if the file could not be parsed
+        """
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cls,)) as executor:
+            return list(executor.map(_parse_one, file_paths, chunksize=8))
     
     def save_to_file(self, file_path: str) -> bool:
         """
@@ -340,7 +638,7 @@ class LaTeXParser:
         """
         try:
             with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(self.generate_latex())
+                file.write(self._text)
             logger.info(f"Successfully saved LaTeX document to: {file_path}")
             return True
         except Exception as e:
@@ -348,7 +646,33 @@ class LaTeXParser:
             return False
 
 
+# Parser reused by a parse_many worker process for every file it is given
+_worker_parser = None
+
+def _init_worker(parser_class: type) -> None:
+    """Create the reusable parser of a parse_many worker process"""
+    global _worker_parser
+    _worker_parser = parser_class()
+
+def _parse_one(file_path: str) -> Optional[Dict[str, str]]:
+    """Parse one file in a parse_many worker, returning its sections' content by name"""
+    _worker_parser.reset()
+    if not _worker_parser.parse_file(file_path):
+        return None
+    return {section_name: _worker_parser.get_section(section_name) for section_name in _worker_parser.sections}
+
+
 # Helper functions for common LaTeX patterns
+@functools.lru_cache(maxsize=None)
+def _get_command_re(command: str) -> re.Pattern:
+    """Compile (once per command) the pattern used by extract_latex_command_content"""
+    return re.compile(fr"\\{command}\{{([^}}]*)\}}")
+
+@functools.lru_cache(maxsize=None)
+def _get_env_re(env_name: str) -> re.Pattern:
+    """Compile (once per environment) the pattern used by extract_environment_content"""
+    return _compile_atomic(fr"\\begin\{{{env_name}\}}((?>[^\\]*(?:\\(?!end\{{{env_name}\}})[^\\]*)*))\\end\{{{env_name}\}}")
+
 def extract_latex_command_content(text: str, command: str) -> List[str]:
     """
     Extract content from a LaTeX command like \\command{content}
@@ -360,8 +684,7 @@ def extract_latex_command_content(text: str, command: str) -> List[str]:
     Returns:
         list: List of matched content
     """
-    pattern = re.compile(fr"\\{command}\{{(.*?)\}}", re.DOTALL)
-    return [match.group(1) for match in pattern.finditer(text)]
+    return [match.group(1) for match in _get_command_re(command).finditer(text)]
 
 def extract_environment_content(text: str, env_name: str) -> List[str]:
     """
@@ -374,5 +697,4 @@ def extract_environment_content(text: str, env_name: str) -> List[str]:
     Returns:
         list: List of matched environment content
     """
-    pattern = re.compile(fr"\\begin\{{{env_name}\}}(.*?)\\end\{{{env_name}\}}", re.DOTALL)
-    return [match.group(1) for match in pattern.finditer(text)]
\ No newline at end of file
+    return [match.group(1) for match in _get_env_re(env_name).finditer(text)]
\ No newline at end of file
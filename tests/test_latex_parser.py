@@ -0,0 +1,389 @@
+import random
+
+import pytest
+
+from app.core.latex_parser import LaTeXParser, extract_environment_content, extract_latex_command_content
+
+
+DOCUMENT = (
+    "\\documentclass{article}\n"
+    "\\usepackage{hyperref}\n"
+    "\\begin{document}\n"
+    "\\section{Summary}\n"
+    "Engineer.\n"
+    "\\section{Experience}\n"
+    "\\textbf{Developer} \\textit{Acme} \\hfill 2020\n"
+    "\\subsection{Projects}\n"
+    "Parser work.\n"
+    "\\section{Skills}\n"
+    "\\begin{itemize}\n"
+    "\\item Python\n"
+    "\\item LaTeX\n"
+    "\\end{itemize}\n"
+    "\\end{document}\n"
+)
+
+
+def parse(content):
+    parser = LaTeXParser()
+    assert parser.parse_content(content)
+    return parser
+
+
+def assert_matches_reparse(parser):
+    """The incrementally updated parser must agree with a fresh parse of its own output"""
+    fresh = parse(parser.generate_latex())
+    assert parser.generate_latex() == fresh.generate_latex()
+    assert list(parser.sections) == list(fresh.sections)
+    for name in fresh.sections:
+        assert parser.sections[name]['start'] == fresh.sections[name]['start']
+        assert parser.sections[name]['end'] == fresh.sections[name]['end']
+        assert parser.get_section(name) == fresh.get_section(name)
+    assert parser.preamble == fresh.preamble
+    assert parser.begin_document_index == fresh.begin_document_index
+    assert parser.end_document_index == fresh.end_document_index
+    assert parser.raw_content == fresh.raw_content
+
+
+def test_parse_content_sections():
+    parser = parse(DOCUMENT)
+    assert list(parser.sections) == ["Summary", "Experience", "Projects", "Skills"]
+    assert parser.get_section("Summary") == "\\section{Summary}\nEngineer.\n"
+    assert parser.preamble == "\\documentclass{article}\n\\usepackage{hyperref}\n"
+    assert parser.begin_document_index == 2
+    assert parser.end_document_index == 14
+
+
+def test_modify_section_changing_headers():
+    parser = parse(DOCUMENT)
+    assert parser.modify_section("Experience", "\\section{Work Experience}\nA\n\\section{Education}\nB\n")
+    assert list(parser.sections) == ["Summary", "Work Experience", "Education", "Projects", "Skills"]
+    assert_matches_reparse(parser)
+
+
+@pytest.mark.parametrize("position", ["start", "end", "Summary", "Projects"])
+def test_add_section(position):
+    parser = parse(DOCUMENT)
+    assert parser.add_section("Education", "University\n", position)
+    assert parser.get_section("Education") == "\\section{Education}\nUniversity\n"
+    assert_matches_reparse(parser)
+
+
+def test_add_section_invalid_position():
+    parser = parse(DOCUMENT)
+    assert not parser.add_section("Education", "University\n", "Missing")
+    assert parser.generate_latex() == DOCUMENT
+
+
+def test_edit_sequence():
+    parser = parse(DOCUMENT)
+    assert parser.add_section("Education", "University\n", "Summary")
+    assert parser.modify_section("Summary", "\\section{Summary}\nShort.\n")
+    assert parser.reorder_sections(["Skills", "Education", "Summary", "Experience"])
+    assert parser.modify_section("Skills", "\\section{Skills}\n\\subsection{Languages}\nPython\n")
+    assert parser.add_section("Awards", "Prize\n", "start")
+    assert_matches_reparse(parser)
+
+
+def test_random_edit_sequences():
+    rng = random.Random(0)
+    names = ["Summary", "Experience", "Skills", "Education", "Awards"]
+    for _ in range(50):
+        parser = parse(DOCUMENT)
+        for _ in range(8):
+            existing = list(parser.sections)
+            operation = rng.choice(["modify", "add", "reorder"])
+            if operation == "modify" and existing:
+                name = rng.choice(existing)
+                header = rng.choice([name, rng.choice(names)])
+                body = rng.choice(["", "text\n", "a\nb\n", "\\subsection{Detail}\nc\n"])
+                parser.modify_section(name, f"\\section{{{header}}}\n{body}")
+            elif operation == "add":
+                position = rng.choice(["start", "end"] + existing)
+                parser.add_section(rng.choice(names), "added\n", position)
+            elif existing:
+                parser.reorder_sections(rng.sample(existing, len(existing)))
+            assert_matches_reparse(parser)
+
+
+def test_duplicate_section_names():
+    content = DOCUMENT.replace("\\section{Skills}", "\\section{Summary}")
+    parser = parse(content)
+    assert list(parser.sections) == ["Summary", "Experience", "Projects"]
+    assert parser.modify_section("Experience", "\\section{Experience}\nNone.\n")
+    assert_matches_reparse(parser)
+    assert parser.add_section("Experience", "Again\n", "start")
+    assert_matches_reparse(parser)
+    assert parser.modify_section("Summary", "\\section{Summary}\nReplaced.\n")
+    assert_matches_reparse(parser)
+
+
+def test_commented_begin_document_in_preamble():
+    content = "% \\begin{document}\n" + DOCUMENT
+    parser = parse(content)
+    assert parser.preamble == "% \\begin{document}\n\\documentclass{article}\n\\usepackage{hyperref}\n"
+    assert parser.begin_document_index == 3
+    assert list(parser.sections) == ["Summary", "Experience", "Projects", "Skills"]
+
+
+@pytest.mark.parametrize("content", [
+    "pre\n\\begin{document}\\section{A} x \\end{document}\n",
+    "\\end{document}\n\\begin{document}\n\\section{A}\nx\n",
+])
+def test_misordered_document_boundaries(content):
+    parser = LaTeXParser()
+    assert not parser.parse_content(content)
+    assert parser.sections == {}
+    assert parser.begin_document_index == -1
+    assert not parser.add_section("B", "y\n", "end")
+    assert not parser.reorder_sections([])
+    assert parser.generate_latex() == content
+
+
+def test_raw_content_lines():
+    parser = parse(DOCUMENT)
+    assert parser.raw_content == DOCUMENT.splitlines(keepends=True)
+    assert parser.raw_content[parser.begin_document_index] == "\\begin{document}\n"
+    assert parser.raw_content[parser.end_document_index] == "\\end{document}\n"
+
+
+@pytest.mark.parametrize("newline", ["\r\n", "\r"])
+def test_line_endings(newline):
+    parser = parse(DOCUMENT.replace("\n", newline))
+    assert parser.generate_latex() == DOCUMENT
+    assert list(parser.sections) == ["Summary", "Experience", "Projects", "Skills"]
+
+
+EXPERIENCE_DOCUMENT = (
+    "\\begin{document}\n"
+    "\\section{Experience}\n"
+    "\\begin{entry}\n"
+    "\\textbf{Developer} \\textit{Acme} \\hfill 2020 -- 2022\n"
+    "Built things.\n"
+    "\\end{entry}\n"
+    "\\begin{entry}\n"
+    "\\textbf{\\textit{Initech}} \\hfill{2018}\n"
+    "\\end{entry}\n"
+    "\\begin{entry}\n"
+    "No fields.\n"
+    "\\end{entry}\n"
+    "\\end{document}\n"
+)
+
+
+def test_extract_experience_fields():
+    experiences = parse(EXPERIENCE_DOCUMENT).extract_experience()
+    assert [(e["title"], e["company"], e["date"]) for e in experiences] == [
+        ("Developer", "Acme", " 2020 -- 2022"),
+        ("\\textit{Initech", "Initech", "2018"),
+        ("", "", ""),
+    ]
+    assert experiences[0]["content"] == "\n\\textbf{Developer} \\textit{Acme} \\hfill 2020 -- 2022\nBuilt things.\n"
+
+
+SKILLS_DOCUMENT = (
+    "\\begin{document}\n"
+    "\\section{Skills}\n"
+    "\\begin{itemize}\n"
+    "\\item Python,   Go\n"
+    "\\item \\textbf{LaTeX} and\n"
+    "  TikZ\n"
+    "\\item SQL\n"
+    "\\end{itemize}\n"
+    "\\begin{itemize}\n"
+    "\\item Ignored\n"
+    "\\end{itemize}\n"
+    "\\end{document}\n"
+)
+
+
+def test_extract_skills():
+    # Only the first list is read, and its last item has no following \item to end it
+    assert parse(SKILLS_DOCUMENT).extract_skills() == ["Python,   Go", "\\textbf{LaTeX} and\n  TikZ"]
+
+
+def test_extract_latex_command_content():
+    text = "\\textbf{A} \\textbf{} \\textit{B} \\textbf{C\nD} \\textbfx{E}"
+    assert extract_latex_command_content(text, "textbf") == ["A", "", "C\nD"]
+    assert extract_latex_command_content(text, "textit") == ["B"]
+    assert extract_latex_command_content(text, "emph") == []
+
+
+def test_extract_environment_content():
+    text = (
+        "\\begin{entry}one\\end{entry}\n"
+        "\\begin{entry}\\textbf{two}\n\\end{other}\\end{entry}\n"
+        "\\begin{other}three\\end{other}"
+    )
+    assert extract_environment_content(text, "entry") == ["one", "\\textbf{two}\n\\end{other}"]
+    assert extract_environment_content(text, "other") == ["three"]
+
+
+def test_unclosed_environments():
+    body = "text \\textbf{x} \\\\ " * 2000
+    assert extract_environment_content("\\begin{entry}" + body, "entry") == []
+    assert extract_environment_content("\\begin{entry}" + body + "\\begin{other}y\\end{other}", "other") == ["y"]
+
+    skills = parse("\\begin{document}\n\\section{Skills}\n\\begin{itemize}\n\\item A\n" + body + "\n\\end{document}\n")
+    assert skills.extract_skills() == []
+
+    experience = parse(
+        "\\begin{document}\n\\section{Experience}\n\\begin{entry}\n\\textbf{Lost}\n" + body
+        + "\n\\begin{job}\\textbf{Kept}\\end{job}\n\\end{document}\n"
+    )
+    assert [e["title"] for e in experience.extract_experience()] == ["Kept"]
+
+
+def test_parse_file(tmp_path):
+    source = tmp_path / "cv.tex"
+    source.write_bytes(DOCUMENT.replace("\n", "\r\n").encode("utf-8"))
+    parser = LaTeXParser()
+    assert parser.parse_file(str(source))
+    assert parser.generate_latex() == DOCUMENT
+    assert parser.preamble == "\\documentclass{article}\n\\usepackage{hyperref}\n"
+    assert list(parser.sections) == ["Summary", "Experience", "Projects", "Skills"]
+    assert not LaTeXParser().parse_file(str(tmp_path / "missing.tex"))
+
+
+def test_section_content_is_sliced_on_access():
+    parser = parse(DOCUMENT)
+    assert parser.get_section("Projects") == "\\subsection{Projects}\nParser work.\n"
+    assert parser.get_section("Missing") is None
+    assert DOCUMENT[parser.sections["Skills"]["start"]:parser.sections["Skills"]["end"]] == parser.get_section("Skills")
+
+
+def test_failed_reparse_clears_sections(tmp_path):
+    parser = parse(DOCUMENT)
+    assert not parser.parse_content("no markers here\n")
+    assert parser.sections == {}
+    assert parser.get_section("Summary") is None
+    assert parser.begin_document_index == -1
+    assert not parser.modify_section("Summary", "\\section{Summary}\nx\n")
+    assert parser.generate_latex() == "no markers here\n"
+
+    # An unreadable file leaves the previously parsed document in place
+    parser = parse(DOCUMENT)
+    assert not parser.parse_file(str(tmp_path / "missing.tex"))
+    assert parser.get_section("Summary") == "\\section{Summary}\nEngineer.\n"
+
+
+def test_reorder_sections():
+    parser = parse(DOCUMENT)
+    assert parser.reorder_sections(["Skills", "Summary", "Experience", "Projects"])
+    assert list(parser.sections) == ["Skills", "Summary", "Experience", "Projects"]
+    assert_matches_reparse(parser)
+
+
+def test_reorder_sections_subset():
+    parser = parse(DOCUMENT)
+    assert parser.reorder_sections(["Projects", "Summary"])
+    assert parser.generate_latex().count("\\section{Skills}") == 0
+    assert_matches_reparse(parser)
+
+
+def test_reorder_sections_unknown_name():
+    parser = parse(DOCUMENT)
+    assert not parser.reorder_sections(["Skills", "Missing"])
+    assert parser.generate_latex() == DOCUMENT
+
+
+def test_modify_section_keeping_header():
+    parser = parse(DOCUMENT)
+    assert parser.modify_section("Summary", "\\section{Summary}\nSenior engineer.\nRemote.\n")
+    assert parser.get_section("Summary") == "\\section{Summary}\nSenior engineer.\nRemote.\n"
+    assert_matches_reparse(parser)
+    assert parser.modify_section("Skills", "\\section{Skills} % no trailing newline")
+    assert_matches_reparse(parser)
+
+
+def test_edits_without_parsed_document():
+    parser = LaTeXParser()
+    assert not parser.add_section("Education", "University\n")
+    assert not parser.add_section("Education", "University\n", "start")
+    assert not parser.modify_section("Education", "University\n")
+    assert not parser.reorder_sections([])
+    assert parser.generate_latex() == ""
+
+    assert not parser.parse_content("no markers here\n")
+    assert not parser.add_section("Education", "University\n")
+    assert not parser.reorder_sections([])
+    assert parser.generate_latex() == "no markers here\n"
+
+
+def test_body_offsets_follow_edits():
+    parser = parse(DOCUMENT)
+    assert parser.add_section("Education", "University\n", "end")
+    assert parser.end_document_index == 16
+    assert parser.raw_content[parser.end_document_index] == "\\end{document}\n"
+    assert parser.add_section("Awards", "Prize\n", "start")
+    assert parser.raw_content[parser.begin_document_index + 1] == "\\section{Awards}\n"
+    assert_matches_reparse(parser)
+
+
+def test_raw_content_refreshed_after_edit():
+    parser = parse(DOCUMENT)
+    lines = parser.raw_content
+    assert parser.raw_content is lines
+    assert parser.modify_section("Summary", "\\section{Summary}\nShort.\nLines.\n")
+    assert parser.raw_content is not lines
+    assert parser.raw_content == parser.generate_latex().splitlines(keepends=True)
+
+
+def test_save_to_file(tmp_path):
+    parser = parse(DOCUMENT)
+    assert parser.modify_section("Summary", "\\section{Summary}\nUpdated.\n")
+    target = tmp_path / "out.tex"
+    assert parser.save_to_file(str(target))
+    assert target.read_text(encoding="utf-8") == parser.generate_latex()
+    assert not parser.save_to_file(str(tmp_path / "missing" / "out.tex"))
+
+
+def test_reset():
+    parser = parse(DOCUMENT)
+    sections = parser.sections
+    parser.reset()
+    assert parser.sections is sections
+    assert parser.sections == {}
+    assert parser.generate_latex() == ""
+    assert parser.preamble == ""
+    assert parser.begin_document_index == -1
+    assert not parser.add_section("Education", "University\n")
+
+    assert parser.parse_content(DOCUMENT.replace("Summary", "Profile"))
+    assert list(parser.sections) == ["Profile", "Experience", "Projects", "Skills"]
+
+
+def test_parse_many(tmp_path):
+    first = tmp_path / "first.tex"
+    first.write_text(DOCUMENT, encoding="utf-8")
+    second = tmp_path / "second.tex"
+    second.write_text(SKILLS_DOCUMENT, encoding="utf-8")
+    paths = [str(second), str(tmp_path / "missing.tex"), str(first)]
+
+    results = LaTeXParser.parse_many(paths, workers=2)
+
+    assert results == [
+        {"Skills": parse(SKILLS_DOCUMENT).get_section("Skills")},
+        None,
+        {
+            "Summary": "\\section{Summary}\nEngineer.\n",
+            "Experience": "\\section{Experience}\n\\textbf{Developer} \\textit{Acme} \\hfill 2020\n",
+            "Projects": "\\subsection{Projects}\nParser work.\n",
+            "Skills": "\\section{Skills}\n\\begin{itemize}\n\\item Python\n\\item LaTeX\n\\end{itemize}\n",
+        },
+    ]
+    assert list(results[2]) == ["Summary", "Experience", "Projects", "Skills"]
+
+
+def test_candidate_sections_read_in_document_order():
+    parser = parse(
+        "\\begin{document}\n"
+        "\\section{Work Experience}\n\\begin{job}\\textbf{Later listed}\\end{job}\n"
+        "\\section{Education}\n\\begin{job}\\textbf{Not experience}\\end{job}\n"
+        "\\section{Experience}\n\\begin{job}\\textbf{First listed}\\end{job}\n"
+        "\\section{Core Competencies}\n\\begin{itemize}\n\\item Leadership\n\\item Hidden\n\\end{itemize}\n"
+        "\\section{Skills}\n\\begin{itemize}\n\\item Python\n\\item Hidden\n\\end{itemize}\n"
+        "\\end{document}\n"
+    )
+    assert [e["title"] for e in parser.extract_experience()] == ["Later listed", "First listed"]
+    assert parser.extract_skills() == ["Leadership", "Python"]